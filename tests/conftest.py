@@ -1,89 +1,91 @@
 """Pytest fixtures for testing the FastAPI application"""
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from app import app, activities
+from tests._test_constants import ORIGINAL_ACTIVITIES
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application"""
-    return TestClient(app)
+# Participant lists are the only mutable leaves, so a reset only needs fresh
+# outer dicts plus a fresh list per activity
+_TEMPLATE = {
+    name: {**details, "participants": []}
+    for name, details in ORIGINAL_ACTIVITIES.items()
+}
+_PARTICIPANTS = {
+    name: tuple(details["participants"])
+    for name, details in ORIGINAL_ACTIVITIES.items()
+}
 
+# Set by the test client on any POST/DELETE, cleared when activities are restored
+_dirty = False
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset the activities database before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Team practices and inter-school basketball matches",
-            "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["liam@mergington.edu", "noah@mergington.edu"]
-        },
-        "Track and Field": {
-            "description": "Running, jumping, and throwing events training",
-            "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["ava@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore drawing, painting, and mixed-media projects",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["mia@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "School Band": {
-            "description": "Practice instruments and perform at school events",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 22,
-            "participants": ["lucas@mergington.edu", "amelia@mergington.edu"]
-        },
-        "Debate Club": {
-            "description": "Develop critical thinking and public speaking through debates",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["ethan@mergington.edu", "harper@mergington.edu"]
-        },
-        "Math Olympiad": {
-            "description": "Advanced problem-solving practice for math competitions",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["james@mergington.edu", "evelyn@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state before each test
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "readonly: test must not send POST/DELETE requests (checked at teardown)"
+    )
+
+
+def _track_mutations(asgi_app):
+    """Wrap an ASGI app so mutating requests mark the activities database dirty"""
+    async def wrapper(scope, receive, send):
+        global _dirty
+        if scope["type"] == "http" and scope["method"] in ("POST", "DELETE"):
+            _dirty = True
+        await asgi_app(scope, receive, send)
+
+    return wrapper
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create an async client shared by the whole test session"""
+    # Call the app in-process on the test event loop. Don't follow redirects
+    # implicitly; tests that want that opt in per request
+    transport = ASGITransport(app=_track_mutations(app), raise_app_exceptions=True)
+    async with AsyncClient(
+        transport=transport, base_url="http://test", follow_redirects=False
+    ) as c:
+        yield c
+
+
+def _restore_activities():
+    """Restore the activities database to its canonical state"""
+    global _dirty
     activities.clear()
-    activities.update(original_activities)
-    
+    for name, template in _TEMPLATE.items():
+        activities[name] = {**template, "participants": list(_PARTICIPANTS[name])}
+    _dirty = False
+
+
+@pytest_asyncio.fixture(scope="session")
+async def all_activities(client):
+    """Fetch GET /activities once for read-only assertions shared across tests"""
+    response = await client.get("/activities")
+    return response.json()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def initial_activities():
+    """Load the canonical activities once before any test or session fixture runs"""
+    _restore_activities()
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request):
+    """Reset the activities database after each test that mutated it
+
+    Only POST/DELETE requests sent through the ``client`` fixture mark the
+    database dirty. A test that changes ``activities`` in-process must call
+    ``_restore_activities`` itself, or its changes leak into later tests.
+    """
+    # Restoring on teardown keeps the database canonical between tests
     yield
-    
-    # Reset again after the test
-    activities.clear()
-    activities.update(original_activities)
+    mutated = _dirty
+    if mutated:
+        _restore_activities()
+    if mutated and request.node.get_closest_marker("readonly"):
+        pytest.fail("readonly test sent a POST/DELETE request", pytrace=False)